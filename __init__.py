@@ -1,17 +1,52 @@
+import bisect
+import re
+import time
+
 import bpy
+import numpy as np
 from bpy_extras import anim_utils
 
+# Matches pose-bone F-Curve data paths, e.g. 'pose.bones["Bone"].location'
+_BONE_DATA_PATH_RE = re.compile(r'pose\.bones\["([^"]+)"\]\.(\w+)')
+
+# Memoized keybinding lookups, keyed on (keymap version, operator name).
+# The version is bumped when a new file is loaded, invalidating old entries.
+_kb_cache = {}
+_kb_version = 0
+
+
+@bpy.app.handlers.persistent
+def _bump_kb_version(_dummy=None, _extra=None):
+    global _kb_version
+    _kb_version += 1
+    _kb_cache.clear()
+
 class RealtimeFCurveUpdater(bpy.types.Operator):
     """Updates F-Curves in real-time when bones are transformed"""
     bl_idname = "pose.realtime_fcurve_update"
     bl_label = "Toggle Realtime F-Curve Update"
     bl_options = {'REGISTER', 'UNDO'}
 
-    _timer = None
+    _timer = None  # The bound _tick callable registered with bpy.app.timers
     _handler_running = False
-    _last_transform_values = {}  # Stores the last transform values to detect changes
     _is_transforming = False  # Tracks whether bones are currently being transformed
     _current_transform_type = None  # Tracks which transform operation is active (translate/rotate/scale)
+    _fcurve_cache = {}  # Maps (bone name, property, index) -> fcurve for the active transform
+    _row_fcurves = []  # Per active bone, its session channel's fcurves indexed by axis
+    _channelbag = None  # Channelbag for the action slot, resolved at transform start
+    _active_bones = []  # Pose bones selected when the active transform started
+    _quat_bones = []  # Active bones with quaternion rotation mode
+    _euler_bones = []  # Active bones with any euler rotation mode
+    _kf_x_cache = {}  # Maps fcurve -> sorted list of its keyframe x-coords
+    _prev_values = None  # (n_bones, 4) array of last-keyed values; NaN = not keyed yet
+    _cur_values = None  # (n_bones, 4) scratch array for the current tick's values
+    _tick_ewma = 0.0  # Smoothed update_fcurves() wall time, for adaptive scheduling
+    _last_state_hash = None  # Hash of the active bones' matrices on the previous tick
+    _editor_areas = []  # Cached animation-editor areas to tag for redraw
+    _paused = False  # True while the Blender window is not focused
+    _last_editor_redraw = 0.0  # perf_counter() time of the last editor redraw
+    _kb_dispatch = {}  # Maps (key, shift, ctrl, alt, oskey) -> transform type, built in start()
+    _view3d_rect = None  # Cached (x, y, width, height) of the 3D Viewport area
 
     @classmethod
     def poll(cls, context):
@@ -25,22 +60,30 @@ class RealtimeFCurveUpdater(bpy.types.Operator):
             self.stop(context)
             return {'FINISHED'}
         
+    @staticmethod
     def get_custom_keybinding(operator_name):
+        cache_key = (_kb_version, operator_name)
+        if cache_key in _kb_cache:
+            return _kb_cache[cache_key]
+        result = None
         user_keyconfig = bpy.context.window_manager.keyconfigs.user
         if user_keyconfig:
             pose_keymap = user_keyconfig.keymaps.get("Pose")
             if pose_keymap:
                 for keymap_item in pose_keymap.keymap_items:
                     if keymap_item.idname == operator_name and not (keymap_item.map_type == 'TWEAK' or keymap_item.value == 'CLICK_DRAG'):
-                        return {
+                        result = {
                             "key": keymap_item.type,  # The key (e.g., 'G', 'R', 'S')
                             "shift": keymap_item.shift,  # Shift modifier
                             "ctrl": keymap_item.ctrl,  # Ctrl modifier
                             "alt": keymap_item.alt,  # Alt modifier
                             "oskey": keymap_item.oskey,  # Cmd (OS key) modifier
                         }
-        return None
-    
+                        break
+        _kb_cache[cache_key] = result
+        return result
+
+    @staticmethod
     def get_transform_keybindings():
         return [kb for kb in [
             RealtimeFCurveUpdater.get_custom_keybinding("transform.translate"),
@@ -51,12 +94,39 @@ class RealtimeFCurveUpdater(bpy.types.Operator):
     def start(self, context):
         self.stop(context)  # Ensure a clean state before starting
         RealtimeFCurveUpdater._handler_running = True
-        RealtimeFCurveUpdater._timer = context.window_manager.event_timer_add(
-            context.scene.realtime_fcurve_timer_interval, window=context.window
+        # Poll via bpy.app.timers so update_fcurves() runs only at the
+        # configured interval, instead of waking the modal handler with a
+        # TIMER event through the full event pipeline. The modal handler
+        # stays registered purely to watch for transform start/end keys.
+        RealtimeFCurveUpdater._timer = self._tick
+        bpy.app.timers.register(
+            RealtimeFCurveUpdater._timer,
+            first_interval=context.scene.realtime_fcurve_timer_interval,
         )
         context.window_manager.modal_handler_add(self)
         context.scene.realtime_fcurve_active = True  # Set the active state to True
-        self._last_transform_values = {}  # Reset stored values
+        # Resolve the keybindings once instead of walking the keymap on every event,
+        # keyed so a PRESS event resolves to its transform type with a single dict
+        # lookup. They are re-resolved on each start(), so keymap edits are picked
+        # up the next time the updater is enabled.
+        self._kb_dispatch = {
+            (kb["key"], kb["shift"], kb["ctrl"], kb["alt"], kb["oskey"]): transform_type
+            for kb, transform_type in [
+                (RealtimeFCurveUpdater.get_custom_keybinding("transform.translate"), 'TRANSLATE'),
+                (RealtimeFCurveUpdater.get_custom_keybinding("transform.rotate"), 'ROTATE'),
+                (RealtimeFCurveUpdater.get_custom_keybinding("transform.resize"), 'SCALE'),
+            ] if kb is not None
+        }
+        self._view3d_rect = None  # Recomputed on the first hit-test
+        # Collect the animation-editor areas once so redraws don't walk
+        # every screen area
+        self._editor_areas = [
+            area for area in context.screen.areas
+            if area.type in {'GRAPH_EDITOR', 'DOPESHEET_EDITOR'}
+        ]
+        self._last_editor_redraw = 0.0
+        self._tick_ewma = 0.0  # Reset the measured tick cost
+        self._paused = False  # Assume the window is focused on start
         self._is_transforming = False  # Reset transform state
         self._current_transform_type = None  # Reset transform type
         self.report({'INFO'}, "Realtime F-Curve Updater Enabled")
@@ -65,143 +135,287 @@ class RealtimeFCurveUpdater(bpy.types.Operator):
         if RealtimeFCurveUpdater._handler_running:
             RealtimeFCurveUpdater._handler_running = False
             if RealtimeFCurveUpdater._timer:
-                context.window_manager.event_timer_remove(RealtimeFCurveUpdater._timer)
+                if bpy.app.timers.is_registered(RealtimeFCurveUpdater._timer):
+                    bpy.app.timers.unregister(RealtimeFCurveUpdater._timer)
                 RealtimeFCurveUpdater._timer = None
             context.scene.realtime_fcurve_active = False  # Set the active state to False
-            self._last_transform_values = {}  # Clear stored values
+            self._kb_dispatch = {}  # Drop the cached keybindings
+            self._view3d_rect = None  # Drop the cached viewport rectangle
+            self._editor_areas = []  # Drop the cached editor areas
             self._is_transforming = False  # Reset transform state
             self._current_transform_type = None  # Reset transform type
             self.report({'INFO'}, "Realtime F-Curve Updater Disabled")
             return {'CANCELLED'}
         
-    def modal(self, context, event):
+    def _tick(self):
+        # bpy.app.timers callback; returning the interval reschedules the
+        # timer, returning None unregisters it
         if not RealtimeFCurveUpdater._handler_running:
-            return {'CANCELLED'}
-        
-        transform_keybindings = RealtimeFCurveUpdater.get_transform_keybindings()
+            return None
+        if self._is_transforming and not self._paused:
+            tick_start = time.perf_counter()
+            self.update_fcurves(bpy.context)
+            tick_time = time.perf_counter() - tick_start
+            # Smooth the measured cost so one slow tick doesn't whipsaw the
+            # interval
+            self._tick_ewma = 0.9 * self._tick_ewma + 0.1 * tick_time
+            if tick_time > 1.0:
+                # Pathologically slow tick (huge rig): back off hard so the
+                # viewport stays responsive
+                print("Realtime F-Curve Updater: update took "
+                      f"{tick_time:.2f}s, backing off to a 1s interval")
+                return 1.0
+        # Stretch the user interval when updates are too slow to fit in it
+        return max(
+            bpy.context.scene.realtime_fcurve_timer_interval,
+            1.1 * self._tick_ewma,
+        )
+
+    def begin_transform(self, context, transform_type):
+        self._is_transforming = True
+        self._current_transform_type = transform_type
+        # Resolve every animated pose-bone channel once per transform session,
+        # so update_fcurves() can look curves up by (bone, property, index)
+        # instead of formatting a data path and running a linear find() per
+        # bone, per axis, per tick. Only the bones selected at transform start
+        # can change, so those are the only ones worth visiting each tick.
+        self._fcurve_cache = {}
+        self._row_fcurves = []
+        self._channelbag = None
+        self._kf_x_cache = {}
+        self._last_state_hash = None
+        # Partition the selection by rotation mode so ROTATE can run two
+        # specialized loops; quaternion bones come first so the value-array
+        # rows line up with that ordering
+        selected = list(context.selected_pose_bones or ())
+        self._quat_bones = [pb for pb in selected if pb.rotation_mode == 'QUATERNION']
+        self._euler_bones = [pb for pb in selected if pb.rotation_mode != 'QUATERNION']
+        self._active_bones = self._quat_bones + self._euler_bones
+        # Per-bone value buffers for the vectorized threshold test; axis 1 is
+        # sized for the widest channel (quaternion rotation)
+        self._prev_values = np.full((len(self._active_bones), 4), np.nan)
+        self._cur_values = np.zeros((len(self._active_bones), 4))
+        obj = context.object
+        if not obj or not obj.animation_data or not obj.animation_data.action:
+            return
+        channelbag = anim_utils.action_get_channelbag_for_slot(
+            obj.animation_data.action, obj.animation_data.action_slot
+        )
+        if not channelbag:
+            return
+        self._channelbag = channelbag
+        for fcurve in channelbag.fcurves:
+            match = _BONE_DATA_PATH_RE.match(fcurve.data_path)
+            if match:
+                self._fcurve_cache[(match.group(1), match.group(2), fcurve.array_index)] = fcurve
+
+        # Resolve each bone's session channel to its fcurves up front, so the
+        # per-tick loop indexes a list by (row, axis) and never touches bone
+        # names or data-path strings again
+        for pb in self._active_bones:
+            if transform_type == 'TRANSLATE':
+                curve_path, count = "location", 3
+            elif transform_type == 'SCALE':
+                curve_path, count = "scale", 3
+            elif pb.rotation_mode == 'QUATERNION':
+                curve_path, count = "rotation_quaternion", 4
+            else:
+                curve_path, count = "rotation_euler", 3
+            self._row_fcurves.append([
+                self._fcurve_cache.get((pb.name, curve_path, axis))
+                for axis in range(count)
+            ])
 
-        # Check if the mouse is over the 3D Viewport
-        mouse_over_view3d = False
+    def end_transform(self):
+        self._is_transforming = False
+        self._current_transform_type = None
+        self._fcurve_cache = {}
+        self._row_fcurves = []
+        self._channelbag = None
+        self._kf_x_cache = {}
+        self._last_state_hash = None
+        self._active_bones = []
+        self._quat_bones = []
+        self._euler_bones = []
+        self._prev_values = None
+        self._cur_values = None
+
+    def neighbor_keyframes(self, fcurve, current_frame):
+        # Binary-search the keyframes at current_frame +/- 1 in a sorted list
+        # of x-coords, cached per fcurve for the transform session. The list
+        # mirrors keyframe_points, so an index into it is also an index into
+        # keyframe_points.
+        x_coords = self._kf_x_cache.get(fcurve)
+        if x_coords is None:
+            x_coords = [kp.co.x for kp in fcurve.keyframe_points]
+            self._kf_x_cache[fcurve] = x_coords
+        # Keep the cache in sync with the keyframe just inserted at current_frame
+        i = bisect.bisect_left(x_coords, current_frame)
+        if i == len(x_coords) or x_coords[i] != current_frame:
+            x_coords.insert(i, current_frame)
+        neighbors = []
+        for frame in (current_frame - 1, current_frame + 1):
+            j = bisect.bisect_left(x_coords, frame)
+            if j < len(x_coords) and x_coords[j] == frame:
+                neighbors.append(fcurve.keyframe_points[j])
+        return neighbors
+
+    def mouse_over_view3d(self, context, event):
+        # Hit-test against the cached viewport rectangle; re-walk the areas
+        # only when there is no cached rectangle or the test misses (so a
+        # changed screen layout is picked up without scanning every event)
+        mouse_x, mouse_y = event.mouse_x, event.mouse_y
+        if self._view3d_rect:
+            x, y, width, height = self._view3d_rect
+            if x <= mouse_x <= x + width and y <= mouse_y <= y + height:
+                return True
+        self._view3d_rect = None
         for area in context.screen.areas:
             if area.type == 'VIEW_3D':
-                mouse_x, mouse_y = event.mouse_x, event.mouse_y
+                self._view3d_rect = (area.x, area.y, area.width, area.height)
                 if (area.x <= mouse_x <= area.x + area.width and
                     area.y <= mouse_y <= area.y + area.height):
-                    mouse_over_view3d = True
-                    break
-
-        # Get the keybindings for each transform operation
-        translate_kb = RealtimeFCurveUpdater.get_custom_keybinding("transform.translate")
-        rotate_kb = RealtimeFCurveUpdater.get_custom_keybinding("transform.rotate")
-        scale_kb = RealtimeFCurveUpdater.get_custom_keybinding("transform.resize")
-
-        # Detect transform start and which operation is being performed
-        if mouse_over_view3d and event.value == 'PRESS':
-            if (translate_kb and 
-                event.type == translate_kb["key"] and
-                event.shift == translate_kb["shift"] and
-                event.ctrl == translate_kb["ctrl"] and
-                event.alt == translate_kb["alt"] and
-                event.oskey == translate_kb["oskey"]):
-                self._is_transforming = True
-                self._current_transform_type = 'TRANSLATE'
-                
-            elif (rotate_kb and 
-                  event.type == rotate_kb["key"] and
-                  event.shift == rotate_kb["shift"] and
-                  event.ctrl == rotate_kb["ctrl"] and
-                  event.alt == rotate_kb["alt"] and
-                  event.oskey == rotate_kb["oskey"]):
-                self._is_transforming = True
-                self._current_transform_type = 'ROTATE'
-                
-            elif (scale_kb and 
-                  event.type == scale_kb["key"] and
-                  event.shift == scale_kb["shift"] and
-                  event.ctrl == scale_kb["ctrl"] and
-                  event.alt == scale_kb["alt"] and
-                  event.oskey == scale_kb["oskey"]):
-                self._is_transforming = True
-                self._current_transform_type = 'SCALE'
+                    return True
+        return False
+
+    def modal(self, context, event):
+        if not RealtimeFCurveUpdater._handler_running:
+            return {'CANCELLED'}
+
+        # Stop burning CPU while the Blender window is unfocused; any
+        # subsequent event means focus is back, since modal handlers only
+        # receive events for their own window
+        if event.type == 'WINDOW_DEACTIVATE':
+            self._paused = True
+            return {'PASS_THROUGH'}
+        self._paused = False
+
+        # Ignore events that can neither start a transform (PRESS) nor end
+        # one (RELEASE of a confirm/cancel key) — this skips the MOUSEMOVE
+        # flood entirely
+        if event.value not in {'PRESS', 'RELEASE'}:
+            return {'PASS_THROUGH'}
+
+        # Detect transform start and which operation is being performed,
+        # using the keybindings cached in start()
+        if event.value == 'PRESS' and self.mouse_over_view3d(context, event):
+            transform_type = self._kb_dispatch.get(
+                (event.type, event.shift, event.ctrl, event.alt, event.oskey)
+            )
+            if transform_type:
+                self.begin_transform(context, transform_type)
 
         # Detect transform end (Left Mouse Click, Enter, Right Click, Escape, Spacebar)
         if event.type in {'LEFTMOUSE', 'RET', 'RIGHTMOUSE', 'ESC', 'SPACE'} and event.value == 'RELEASE':
-            self._is_transforming = False
-            self._current_transform_type = None
-
-        # Only update F-curves if bones are being transformed
-        if self._is_transforming and event.type == 'TIMER':
-            self.update_fcurves(context)
+            self.end_transform()
 
         return {'PASS_THROUGH'}
 
     def update_fcurves(self, context):
-        obj = context.object
-        if not obj or not obj.animation_data:
+        # Cheapest guards first: the action, channelbag and fcurves were all
+        # resolved at transform start, so a session without a channelbag (or
+        # any cached fcurves to write into) has nothing to do
+        if self._channelbag is None or self._prev_values is None or not self._row_fcurves:
             return
-        
-        action = obj.animation_data.action
-        action_slot = obj.animation_data.action_slot
 
-    # Retrieve the channel bag for the action slot
-        channelbag = anim_utils.action_get_channelbag_for_slot(action, action_slot)
+        # Skip the tick entirely when no selected bone has moved since the
+        # previous one (e.g. the user is holding the mouse still mid-drag)
+        state_hash = hash(tuple(
+            tuple(pb.matrix_basis[i]) for pb in self._active_bones for i in range(4)
+        ))
+        if state_hash == self._last_state_hash:
+            return
+        self._last_state_hash = state_hash
+
+        # FCurves whose handles need recomputing; updated once per tick
+        # instead of once per touched keyframe
+        dirty_fcurves = set()
+        changed = False
 
-        if not action:
+        # Resolve the channel for the current transform type once, outside
+        # the bone loop; only ROTATE depends on the per-bone rotation mode
+        if self._current_transform_type == 'TRANSLATE':
+            base_channel = ("location", 3)
+        elif self._current_transform_type == 'SCALE':
+            base_channel = ("scale", 3)
+        elif self._current_transform_type == 'ROTATE':
+            base_channel = None  # Resolved per bone below
+        else:
             return
 
-        for pb in obj.pose.bones:
-            # Only update curves for the current transform type
-            if self._current_transform_type == 'TRANSLATE':
-                transform_paths = [("location", 3)]
-            elif self._current_transform_type == 'ROTATE':
-                transform_paths = [("rotation_quaternion" if pb.rotation_mode == 'QUATERNION' else "rotation_euler", 
-                                   4 if pb.rotation_mode == 'QUATERNION' else 3)]
-            elif self._current_transform_type == 'SCALE':
-                transform_paths = [("scale", 3)]
-            else:
-                return
-            
-            for curve_path, count in transform_paths:
-                for index in range(count):
-                    fcurve = channelbag.fcurves.find(f'pose.bones["{pb.name}"].{curve_path}', index=index)
-                    if fcurve:
-                        current_value = getattr(pb, curve_path)[index]
-                        last_value = self._last_transform_values.get((pb.name, curve_path, index), None)
-
-                        # Only update if the value has changed significantly
-                        if last_value is None or abs(current_value - last_value) > context.scene.realtime_fcurve_update_threshold:
-                            # Insert or update the keyframe
-                            keyframe = fcurve.keyframe_points.insert(context.scene.frame_current, current_value, options={'FAST'})
-                            self._last_transform_values[(pb.name, curve_path, index)] = current_value
-
-                            # Update handles for the current keyframe and its immediate neighbors
-                            current_frame = context.scene.frame_current
-                            keyframes_to_update = []
-
-                            # Find the current keyframe and its neighbors
-                            for kf in fcurve.keyframe_points:
-                                if kf.co.x == current_frame:
-                                    keyframes_to_update.append(kf)
-                                elif kf.co.x == current_frame - 1:  # Previous keyframe
-                                    keyframes_to_update.append(kf)
-                                elif kf.co.x == current_frame + 1:  # Next keyframe
-                                    keyframes_to_update.append(kf)
-
-                            # Update handles for the selected keyframes
-                            for kf in keyframes_to_update:
-                                if kf.handle_left_type == 'AUTO_CLAMPED' or kf.handle_right_type == 'AUTO_CLAMPED':
-                                    kf.handle_left_type = 'AUTO_CLAMPED'
-                                    kf.handle_right_type = 'AUTO_CLAMPED'
-                                    fcurve.update()  # Force update the handles
-
-        # Throttle UI updates
-        if context.scene.frame_current % 5 == 0:  # Only redraw every 5 frames
-            for area in context.screen.areas:
-                if area.type in {'GRAPH_EDITOR', 'DOPESHEET_EDITOR'}:
-                    area.tag_redraw()
-        
-        context.view_layer.update()
-        bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+        # Gather every bone's current channel values into one array. A slice
+        # read per bone pulls the whole channel out of the RNA wrapper at
+        # once, instead of indexing it per axis.
+        cur = self._cur_values
+        prev = self._prev_values
+        if base_channel is not None:
+            curve_path, count = base_channel
+            for bone_index, pb in enumerate(self._active_bones):
+                cur[bone_index, :count] = getattr(pb, curve_path)[:]
+        else:
+            # ROTATE: two loops specialized per rotation mode, with the
+            # channel hoisted as a loop constant. _active_bones is ordered
+            # quaternion-first, so the row indices line up.
+            for bone_index, pb in enumerate(self._quat_bones):
+                cur[bone_index, :4] = pb.rotation_quaternion[:]
+            offset = len(self._quat_bones)
+            for bone_index, pb in enumerate(self._euler_bones):
+                cur[offset + bone_index, :3] = pb.rotation_euler[:]
+
+        # One vectorized threshold test across all bones and axes; NaN in
+        # prev marks axes that have not been keyed this session yet
+        threshold = context.scene.realtime_fcurve_update_threshold
+        mask = np.isnan(prev) | (np.abs(cur - prev) > threshold)
+
+        current_frame = context.scene.frame_current
+        row_fcurves = self._row_fcurves
+        for bone_index, axis in np.argwhere(mask):
+            row = row_fcurves[bone_index]
+            if axis >= len(row):  # Unused lane of a 3-axis channel
+                continue
+            fcurve = row[axis]
+            if not fcurve:
+                continue
+
+            # Insert or update the keyframe
+            current_value = float(cur[bone_index, axis])
+            keyframe = fcurve.keyframe_points.insert(current_frame, current_value, options={'FAST'})
+            prev[bone_index, axis] = current_value
+            changed = True
+
+            # Handles only need refreshing on auto-clamped curves; check the
+            # keyframe just inserted before bothering to search for neighbors
+            if (keyframe.handle_left_type != 'AUTO_CLAMPED' and
+                    keyframe.handle_right_type != 'AUTO_CLAMPED'):
+                continue
+
+            # Update handles for the keyframe just inserted and its
+            # immediate neighbors
+            keyframes_to_update = [keyframe]
+            keyframes_to_update += self.neighbor_keyframes(fcurve, current_frame)
+
+            for kf in keyframes_to_update:
+                if kf.handle_left_type == 'AUTO_CLAMPED' or kf.handle_right_type == 'AUTO_CLAMPED':
+                    kf.handle_left_type = 'AUTO_CLAMPED'
+                    kf.handle_right_type = 'AUTO_CLAMPED'
+                    dirty_fcurves.add(fcurve)
+
+        # Force a single handle update per touched fcurve
+        for fc in dirty_fcurves:
+            fc.update()
+
+        # Throttle editor redraws by wall clock (at most every 100ms) —
+        # frame_current is constant while transforming, so a frame-number
+        # gate either fired every tick or never. tag_redraw() lets Blender
+        # schedule the redraw itself rather than forcing a synchronous swap.
+        now = time.perf_counter()
+        if now - self._last_editor_redraw > 0.1:
+            self._last_editor_redraw = now
+            for area in self._editor_areas:
+                area.tag_redraw()
+
+        if changed:
+            context.view_layer.update()
 
 class RealtimeFCurvePanel(bpy.types.Panel):
     """Creates a Panel in the Animation tab of the 3D Viewport"""
@@ -230,6 +444,7 @@ class RealtimeFCurvePanel(bpy.types.Panel):
 def register():
     bpy.utils.register_class(RealtimeFCurveUpdater)
     bpy.utils.register_class(RealtimeFCurvePanel)
+    bpy.app.handlers.load_post.append(_bump_kb_version)
     bpy.types.Scene.realtime_fcurve_active = bpy.props.BoolProperty(default=False)
     bpy.types.Scene.realtime_fcurve_timer_interval = bpy.props.FloatProperty(
         name="Timer Interval",
@@ -247,6 +462,8 @@ def register():
     )
 
 def unregister():
+    if _bump_kb_version in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_bump_kb_version)
     bpy.utils.unregister_class(RealtimeFCurveUpdater)
     bpy.utils.unregister_class(RealtimeFCurvePanel)
     del bpy.types.Scene.realtime_fcurve_active